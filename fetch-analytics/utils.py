@@ -1,17 +1,25 @@
 import json
-from pandas import DataFrame
-from numbers import Number
+from pandas import DataFrame, Series, to_numeric
+from pandas.api.types import is_bool_dtype, is_integer_dtype
 import logging
-import re
 import logging
 from typing import (
     List,
     Dict,
     Optional,
+    Union,
 )
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 ISO_8601_FORMAT: str = '%Y-%m-%dT%H:%M:%S'
+READ_BUFFER_SIZE: int = 1 << 20  # 1 MiB
+# Supported datetime range, in microseconds since the epoch
+DATETIME_MIN_MICROS: int = (
+    (datetime.min - datetime(1970, 1, 1)) // timedelta(microseconds=1)
+)
+DATETIME_MAX_MICROS: int = (
+    (datetime.max - datetime(1970, 1, 1)) // timedelta(microseconds=1)
+)
 
 def calc_col_lengths(df: DataFrame) -> Dict[str, int]:
     """
@@ -25,47 +33,52 @@ def calc_col_lengths(df: DataFrame) -> Dict[str, int]:
     if df.empty:
         return dict()
 
-    df_cols = list(df.columns)
-    col_lengths_map = dict()
+    # Buffer Percentage of 1 for max size
+    buffer_percentage = 0.01
 
-    def _to_literal(
-        val: str,  # val is already stringify-ed and nulls ignored
-    ) -> str:
+    def _calc_col_length(values: Series) -> int:
         """
-        Convert value to literal value using repr.
+        Get largest length of values in given column, including buffer.
 
-        :param val: str,
-        :return: str,
-            Literal value.
+        :param values: Series,
+            Column values.
+        :return: int,
+            Length value.
         """
-        ans = repr(val)
-        ans = ans[1:-1].encode('utf-8')
-        return ans
-
-    for col in df_cols:
-        max_length = (
-            df[~df[col].isnull()][col]
-            .astype('str')
-            .apply(_to_literal)
-            .str.len()
-            .max()
-        )
-
-        # Buffer Percentage of 1 for max size
-        buffer_percentage = 0.01
+        values = values.dropna()
 
-        if isinstance(max_length, Number):
-            try:
-                col_lengths_map[col] = int(
-                    max_length + max_length * buffer_percentage
+        if values.empty:
+            max_length = 0
+        elif is_integer_dtype(values) or is_bool_dtype(values):
+            # Literals have no escapes and the longest is always an extreme
+            max_length = max(len(str(values.min())), len(str(values.max())))
+        else:
+            # Length of the utf-8 encoded literal value, minus the repr quotes.
+            # Repeated values share a length, so only measure each once
+            values = values.astype('str').drop_duplicates().to_numpy()
+            if all(map(str.isascii, values)):
+                # ASCII literals are one byte per character, so the whole
+                # loop can stay within builtins without encoding
+                max_length = max(map(len, map(repr, values))) - 2
+            else:
+                max_length = max(
+                    len(repr(val).encode('utf-8')) - 2 for val in values
                 )
-            except ValueError:
-                col_lengths_map[col] = 0
+
+        return int(max_length + max_length * buffer_percentage)
+
+    col_lengths_map = dict()
+    # Iterate by position so duplicate column names are measured separately,
+    # keeping the larger length for the shared name
+    for col, values in df.items():
+        col_lengths_map[col] = max(
+            _calc_col_length(values), col_lengths_map.get(col, 0)
+        )
 
     return col_lengths_map
 
 def load_json(file_path):
-    with open(file_path, "r") as f:
+    with open(file_path, "rb", buffering=READ_BUFFER_SIZE) as f:
         return [json.loads(line) for line in f]
 
 def pd_preview(
@@ -95,11 +108,19 @@ def pd_preview(
     :return: DataFrame,
         Original input DataFrame.
     """
-    if cols is None:
-        cols = list(df.columns)
+    # Preview is only logged at INFO, skip building it when INFO is disabled
+    if not logging.getLogger().isEnabledFor(logging.INFO):
+        return df
 
-    df_cols = list(df.columns)
-    df_types = list(df.dtypes)
+    if cols is not None:
+        cols = set(cols)
+
+    # Resolve previewed columns once, numbered by their position in the frame
+    preview_cols = [
+        (col_counter, col, dtype)
+        for col_counter, (col, dtype) in enumerate(df.dtypes.items(), 1)
+        if cols is None or col in cols
+    ]
 
     if tag:
         print_lines = [f'\n----- DATAFRAME PREVIEW (tag: {tag}) -----']
@@ -112,53 +133,38 @@ def pd_preview(
     else:
         print_lines.append('No index name defined')
 
+    if columns_only:
+        # Column names don't depend on the rows, so list them once
+        print_lines.extend(f"    '{col}'," for _, col, _ in preview_cols)
+        logging.info('\n'.join(print_lines))
+        return df
+
+    df_preview = df.head(num_rows)
+    if cols is not None:
+        df_preview = df_preview.iloc[
+            :, [col_counter - 1 for col_counter, _, _ in preview_cols]
+        ]
+
     col_lengths_map = {}
     if calculate_lengths:
-        df_copy = df.copy()
-        if num_rows is not None:
-            df_copy = df.head(num_rows)
-
-        col_lengths_map = calc_col_lengths(df_copy)
+        # calc_col_lengths only reads the frame, so no copy is needed
+        col_lengths_map = calc_col_lengths(df_preview)
 
-    for idx, _row in df.head(num_rows).iterrows():
+    # itertuples yields Python scalars, so values log as 1 rather than
+    # np.int64(1)
+    for idx, *vals in df_preview.itertuples(index=True, name=None):
         print_lines.append(f'Row: {idx}')
 
-        col_counter = 0
-        for col, dtype in zip(df_cols, df_types):
-            col_counter += 1
-            if col not in cols:
-                continue
-
-            try:
-                val = df.at[idx, col]
-            except ValueError as exc:
-                msg = f'Could not get value at ({idx}, {col}).'
-                if not df.index.is_unique:
-                    msg += (
-                        ' Index is not unique; you may need to specify a '
-                        'different index column(s) or set index_col=False when '
-                        'creating the DataFrame.'
-                    )
-                if not df.columns.is_unique:
-                    msg += (
-                        f' Column names are not unique; you may need to rename '
-                        f'duplicate columns or specify fixed column names when '
-                        f'creating the DataFrame: {sorted(df.columns)}.'
-                    )
-                raise ValueError(msg) from exc
-
-            if columns_only:
-                print_lines.append(f"    '{col}',")
+        for (col_counter, col, dtype), val in zip(preview_cols, vals):
+            if calculate_lengths:
+                print_lines.append(
+                    f"    {col_counter}. '{col}' ({dtype}: "
+                    f"{col_lengths_map.get(col, 0)}): {repr(val)}"
+                )
             else:
-                if calculate_lengths:
-                    print_lines.append(
-                        f"    {col_counter}. '{col}' ({dtype}: "
-                        f"{col_lengths_map.get(col, 0)}): {repr(val)}"
-                    )
-                else:
-                    print_lines.append(
-                        f"    {col_counter}. '{col}' ({dtype}): {repr(val)}"
-                    )
+                print_lines.append(
+                    f"    {col_counter}. '{col}' ({dtype}): {repr(val)}"
+                )
 
     logging.info('\n'.join(print_lines))
 
@@ -197,11 +203,12 @@ def pd_cols_remove_special_characters(
         df_cols = list(df.columns)
         cols = df_cols
 
-    rename_map = {}
-    for col in cols:
-        pattern = f"[{remove_characters}]"
-        new_col = re.sub(pattern, replace_char, col)
-        rename_map[col] = new_col
+    table = str.maketrans(dict.fromkeys(remove_characters, replace_char))
+    # Only keep columns whose names actually change
+    rename_map = {
+        col: new_col for col in cols
+        if (new_col := col.translate(table)) != col
+    }
 
     if rename_map:
         df.rename(columns=rename_map, inplace=True)
@@ -238,9 +245,12 @@ def pd_rename_cols(
     df_cols = set(df.columns)
 
     if override:
-        for out_col in rename_map.values():
-            if out_col in df_cols:
-                del df[out_col]
+        drop_cols = [
+            out_col for out_col in dict.fromkeys(rename_map.values())
+            if out_col in df_cols
+        ]
+        if drop_cols:
+            df.drop(columns=drop_cols, inplace=True)
     else:
         for out_col in rename_map.values():
             if out_col in df_cols:
@@ -260,19 +270,46 @@ def pd_rename_cols(
     df.rename(columns=rename_map, inplace=True)
     return df
 
-def convert_epoch_to_datetime(epoch: float, format=ISO_8601_FORMAT) -> str:
+def convert_epoch_to_datetime(
+    epoch: Union[float, Series],
+    format=ISO_8601_FORMAT,
+) -> Union[str, Series]:
     """
     Converts epoch date to UTC datetime string value.
-    :param epoch: float,
-        Epoch value.
+    :param epoch: Union[float, Series],
+        Epoch value in milliseconds, or array-like of epoch values which will
+        be converted all at once.
     :param format: str,
         Output datetime format.
-    :return:
+    :return: Union[str, Series],
+        Datetime string, or a Series of datetime strings for array-like input
+        with NaN in place of missing or zero epochs.
     """
+    if hasattr(epoch, '__len__') and not isinstance(epoch, str):
+        epochs = to_numeric(Series(epoch))
+        # Falsy epochs are skipped, same as for a single value
+        epochs = epochs.where(epochs != 0)
+        # Convert milliseconds to microseconds, as datetime64[us] covers the
+        # full datetime range where the default nanosecond unit does not
+        micros = (epochs * 1000).round()
+        # Fail like a single value would rather than wrapping in the cast
+        out_of_range = (micros < DATETIME_MIN_MICROS) | (
+            micros > DATETIME_MAX_MICROS
+        )
+        if out_of_range.any():
+            raise ValueError(
+                f'Epoch values out of datetime range: '
+                f'{epochs[out_of_range].tolist()}'
+            )
+        micros_values = micros.fillna(0).astype('int64').to_numpy()
+        datetimes_converted = Series(
+            micros_values.astype('datetime64[us]'), index=micros.index
+        ).where(micros.notna())
+        return datetimes_converted.dt.strftime(format)
 
     if not epoch:
         return
-    epoch = float(epoch) / 1000
     # Convert milliseconds to seconds
-    datetime_converted = datetime(1970, 1, 1) + timedelta(seconds=epoch)
+    epoch = float(epoch) / 1000
+    datetime_converted = datetime.fromtimestamp(epoch, tz=timezone.utc)
     return datetime_converted.strftime(format)
\ No newline at end of file